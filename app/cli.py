@@ -1,6 +1,8 @@
+import io
+import re
 import sys
 import functools
-from tabulate import tabulate
+import contextlib
 from app.repo import (
     REPO_FILE_PATH,
     load_tasks,
@@ -11,10 +13,10 @@ from app.repo import (
     mark_task_done,
 )
 from datetime import datetime
-from app.schemas import Task, TaskRow, LoadTasksOk, LoadTasksErr
+from app.schemas import Task, TaskStatus, LoadTasksOk, LoadTasksErr
 from pathlib import Path
 from app.enums import TaskStatusEnum, MessageKind
-from typing import TextIO, Callable, TypeVar, ParamSpec
+from typing import TextIO, Callable, Iterable, Iterator, Sequence, TypeVar, ParamSpec
 
 __all__ = (
     "repo_path_cmd",
@@ -33,29 +35,95 @@ _T = TypeVar("_T")
 _P = ParamSpec("_P")
 
 type _LoadTasksResult = LoadTasksOk | LoadTasksErr
+type _RepoStamp = tuple[int, int, int]
 
+# On Python 3.12+ `fromisoformat` is the C implementation and accepts the
+# full ISO 8601 form we write, so no third-party parser is needed.
+_parse_iso = datetime.fromisoformat
+
+_DEFAULT_DT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Line breaks that switch the task table to the multi-line cell layout.
+_LINE_BREAK_RE = re.compile(r"[\r\n]")
+
+_STATUS_LABELS: dict[str, str] = {e.value: e.label for e in TaskStatusEnum}
+
+_TASK_COLUMNS: tuple[str, ...] = (
+    "id",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_dt(isodt: str, fmt: str = _DEFAULT_DT_FORMAT) -> str:
+    # The local timezone is resolved once per distinct timestamp (the result is
+    # cached). A fixed-offset snapshot is not used on purpose: it would render
+    # timestamps from the other side of a DST transition with the wrong offset.
+    dt = _parse_iso(isodt).astimezone()
+    if fmt == _DEFAULT_DT_FORMAT:
+        return (
+            f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+        )
 
-def _format_dt(isodt: str, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
-    dt = datetime.fromisoformat(isodt).astimezone()
     return dt.strftime(fmt)
 
 
-def _task_to_row(task: Task) -> TaskRow:
-    return {
-        "id": task["id"],
-        "description": task["description"],
-        "status": TaskStatusEnum(task["status"]).label,
-        "created_at": _format_dt(task["created_at"]),
-        "updated_at": _format_dt(task["updated_at"]),
-    }
+def _task_columns(tasks: list[Task]) -> tuple[list[str], ...]:
+    """
+    Build the table cells column by column (one list per column, in
+    `_TASK_COLUMNS` order) instead of one row dict per task.
+    """
+    return (
+        [str(t["id"]) for t in tasks],
+        [t["description"] for t in tasks],
+        [_STATUS_LABELS[t["status"]] for t in tasks],
+        [_format_dt(t["created_at"]) for t in tasks],
+        [_format_dt(t["updated_at"]) for t in tasks],
+    )
+
+
+def _repo_stamp(repo_path: Path) -> _RepoStamp | None:
+    """
+    Identify the current state of the repository file by its inode,
+    modification time and size, or return None if it cannot be stat-ed.
+    """
+    try:
+        st = repo_path.stat()
+    except OSError:
+        return
+
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+@functools.lru_cache(maxsize=8)
+def _load_tasks_at(repo_path: Path, stamp: _RepoStamp) -> list[Task]:
+    """
+    Load tasks for a given repository state.
+
+    `stamp` is not used directly: it is part of the cache key, so any change
+    of the repository file invalidates the cached list. The returned list is
+    shared between callers and must not be mutated.
+    """
+    return load_tasks(repo_path=repo_path)
 
 
 def _load_tasks_safe(*, repo_path: Path) -> _LoadTasksResult:
+    stamp = _repo_stamp(repo_path)
     try:
-        return LoadTasksOk(success=True, value=load_tasks(repo_path=repo_path))
+        if stamp is None:
+            # Missing or unreadable file: let `load_tasks` handle and report it.
+            tasks = load_tasks(repo_path=repo_path)
+        else:
+            tasks = _load_tasks_at(repo_path, stamp)
     except (ValueError, OSError, TypeError) as e:
         return LoadTasksErr(success=False, msg=str(e))
 
+    return LoadTasksOk(success=True, value=tasks)
+
 
 def _print_msg(
     msg: str, kind: MessageKind = MessageKind.INFO, *, file: TextIO = sys.stdout
@@ -76,119 +144,201 @@ def _get_tasks(*, repo_path: Path) -> list[Task] | None:
     return res.value
 
 
+def _iter_task_table(columns: Sequence[list[str]]) -> Iterator[str]:
+    """
+    Yield the lines of a grid table (the tabulate "simple_grid" layout).
+
+    `columns` holds the cells column by column, in `_TASK_COLUMNS` order, so
+    each width is measured with a single scan of one list. Every cell is
+    stripped, left-aligned and otherwise rendered as-is (no number parsing).
+    As in tabulate, if any cell contains a line break, cells are split into
+    lines, widths are measured per line, and shorter cells are padded with
+    blank lines. Each yielded line ends with a newline, so the table can be
+    streamed with `writelines`.
+    """
+    multiline = any(_LINE_BREAK_RE.search("".join(col)) for col in columns)
+    columns = [[v.strip() for v in col] for col in columns]
+
+    def cell_width(value: str) -> int:
+        if not multiline:
+            return len(value)
+        return max(map(len, _LINE_BREAK_RE.split(value)))
+
+    widths = [
+        max(len(h) + 2, max(map(cell_width, col), default=0))
+        for h, col in zip(_TASK_COLUMNS, columns)
+    ]
+
+    def rule(left: str, mid: str, right: str) -> str:
+        return left + mid.join("─" * (w + 2) for w in widths) + right + "\n"
+
+    def line(values: Iterable[str]) -> str:
+        return "│ " + " │ ".join(v.ljust(w) for v, w in zip(values, widths)) + " │\n"
+
+    sep = rule("├", "┼", "┤")
+    yield rule("┌", "┬", "┐")
+    yield line(_TASK_COLUMNS)
+    for values in zip(*columns):
+        yield sep
+        if not multiline:
+            yield line(values)
+            continue
+
+        cells = [v.splitlines() for v in values]
+        for i in range(max(map(len, cells))):
+            yield line(c[i] if i < len(c) else "" for c in cells)
+    yield rule("└", "┴", "┘")
+
+
+@contextlib.contextmanager
+def _batched_stdout() -> Iterator[TextIO]:
+    """
+    Yield stdout with line buffering suspended, flushing once on exit.
+
+    On a terminal stdout is line-buffered, so writing a table line by line
+    would issue one `write` syscall per line.
+    """
+    out = sys.stdout
+    line_buffering = isinstance(out, io.TextIOWrapper) and out.line_buffering
+    if line_buffering:
+        out.reconfigure(line_buffering=False)
+    try:
+        yield out
+    finally:
+        if line_buffering:
+            out.reconfigure(line_buffering=True)
+        out.flush()
+
+
 def _print_tasks(tasks: list[Task]) -> None:
-    rows = (_task_to_row(t) for t in tasks)
-    print(tabulate(rows, "keys", tablefmt="simple_grid", disable_numparse=True))
+    # Stream through the (buffered) text layer instead of joining one large
+    # string for the whole table.
+    with _batched_stdout() as out:
+        out.writelines(_iter_task_table(_task_columns(tasks)))
 
 
-def _filter_tasks_by_status(tasks: list[Task], status: TaskStatusEnum) -> list[Task]:
-    return [t for t in tasks if t["status"] == status.value]
+def _partition_by_status(tasks: list[Task]) -> dict[str, list[Task]]:
+    # Buckets are pre-seeded: `setdefault(key, [])` would allocate a throwaway
+    # list for every task. Loaded tasks are validated, so every status is known.
+    by_status: dict[str, list[Task]] = {e.value: [] for e in TaskStatusEnum}
+    for t in tasks:
+        by_status[t["status"]].append(t)
 
+    return by_status
 
-def _get_tasks_by_status(
-    status: TaskStatusEnum, *, repo_path: Path
-) -> list[Task] | None:
-    tasks = _get_tasks(repo_path=repo_path)
-    if tasks is None:
-        return
 
-    return _filter_tasks_by_status(tasks, status)
+@functools.lru_cache(maxsize=8)
+def _partition_at(repo_path: Path, stamp: _RepoStamp) -> dict[str, list[Task]]:
+    return _partition_by_status(_load_tasks_at(repo_path, stamp))
+
 
+def _get_partitioned(*, repo_path: Path) -> dict[str, list[Task]] | None:
+    stamp = _repo_stamp(repo_path)
+    if stamp is None:
+        tasks = _get_tasks(repo_path=repo_path)
+        if tasks is None:
+            return
 
-def _safe_action(
-    *, handled: tuple[type[Exception], ...] = (ValueError, OSError, TypeError)
-) -> Callable[[Callable[_P, _T]], Callable[_P, _T | None]]:
-    def deco(fn: Callable[_P, _T]) -> Callable[_P, _T | None]:
-        @functools.wraps(fn)
-        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T | None:
-            try:
-                return fn(*args, **kwargs)
-            except handled as e:
-                _print_err(str(e))
+        return _partition_by_status(tasks)
 
-        return wrapper
+    try:
+        return _partition_at(repo_path, stamp)
+    except (ValueError, OSError, TypeError) as e:
+        _print_err(str(e))
 
-    return deco
+
+def _get_tasks_by_status(status: TaskStatus, *, repo_path: Path) -> list[Task] | None:
+    by_status = _get_partitioned(repo_path=repo_path)
+    if by_status is None:
+        return
+
+    return by_status.get(status, [])
+
+
+def _run_safely(
+    fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+) -> _T | None:
+    try:
+        return fn(*args, **kwargs)
+    except (ValueError, OSError, TypeError) as e:
+        _print_err(str(e))
 
 
 def repo_path_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
     _print_msg(str(repo_path))
 
 
-def show_all_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
-    tasks = _get_tasks(repo_path=repo_path)
+def _show(status: TaskStatus | None, empty_msg: str, *, repo_path: Path) -> None:
+    if status is None:
+        tasks = _get_tasks(repo_path=repo_path)
+    else:
+        tasks = _get_tasks_by_status(status, repo_path=repo_path)
+
     if tasks is None:
         return
     if not tasks:
-        _print_msg("No tasks have been created yet")
+        _print_msg(empty_msg)
         return
 
     _print_tasks(tasks)
 
 
-def show_todo_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
-    tasks = _get_tasks_by_status(TaskStatusEnum.TODO, repo_path=repo_path)
-    if tasks is None:
-        return
-    if not tasks:
-        _print_msg("No TODO tasks found")
-        return
+def show_all_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
+    _show(None, "No tasks have been created yet", repo_path=repo_path)
 
-    _print_tasks(tasks)
+
+def show_todo_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
+    _show("todo", "No TODO tasks found", repo_path=repo_path)
 
 
 def show_in_progress_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
-    tasks = _get_tasks_by_status(TaskStatusEnum.IN_PROGRESS, repo_path=repo_path)
-    if tasks is None:
-        return
-    if not tasks:
-        _print_msg("No IN PROGRESS tasks found")
-        return
-
-    _print_tasks(tasks)
+    _show("in_progress", "No IN PROGRESS tasks found", repo_path=repo_path)
 
 
 def show_done_cmd(*, repo_path: Path = REPO_FILE_PATH) -> None:
-    tasks = _get_tasks_by_status(TaskStatusEnum.DONE, repo_path=repo_path)
-    if tasks is None:
-        return
-    if not tasks:
-        _print_msg("No DONE tasks found")
-        return
-
-    _print_tasks(tasks)
+    _show("done", "No DONE tasks found", repo_path=repo_path)
 
 
-@_safe_action()
 def add_task_cmd(description: str, *, repo_path: Path = REPO_FILE_PATH) -> None:
-    id = create_task(description, repo_path=repo_path)
+    id = _run_safely(create_task, description, repo_path=repo_path)
+    if id is None:
+        return
+
     _print_msg(f"Task added successfully (ID: {id})")
 
 
-@_safe_action()
 def update_task_cmd(
     task_id: int, description: str, *, repo_path: Path = REPO_FILE_PATH
 ) -> None:
-    updated = update_task(task_id, description, repo_path=repo_path)
+    updated = _run_safely(update_task, task_id, description, repo_path=repo_path)
+    if updated is None:
+        return
+
     _print_msg(f"Task {task_id} updated")
     _print_tasks([updated])
 
 
-@_safe_action()
 def delete_task_cmd(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> None:
-    delete_task(task_id, repo_path=repo_path)
+    deleted = _run_safely(delete_task, task_id, repo_path=repo_path)
+    if deleted is None:
+        return
+
     _print_msg(f"Task {task_id} deleted")
 
 
-@_safe_action()
 def mark_in_progress_cmd(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> None:
-    marked = mark_task_in_progress(task_id, repo_path=repo_path)
+    marked = _run_safely(mark_task_in_progress, task_id, repo_path=repo_path)
+    if marked is None:
+        return
+
     _print_msg(f"Task {task_id} marked as IN PROGRESS")
     _print_tasks([marked])
 
 
-@_safe_action()
 def mark_done_cmd(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> None:
-    marked = mark_task_done(task_id, repo_path=repo_path)
+    marked = _run_safely(mark_task_done, task_id, repo_path=repo_path)
+    if marked is None:
+        return
+
     _print_msg(f"Task {task_id} marked as DONE")
     _print_tasks([marked])
@@ -1,20 +1,11 @@
 import click
 from pathlib import Path
-from app.cli import (
-    repo_path_cmd,
-    show_all_cmd,
-    show_todo_cmd,
-    show_in_progress_cmd,
-    show_done_cmd,
-    add_task_cmd,
-    update_task_cmd,
-    delete_task_cmd,
-    mark_in_progress_cmd,
-    mark_done_cmd,
-)
 
 __all__ = ("repo", "list", "add", "update", "delete", "mark_in_progress", "mark_done")
 
+# Command implementations are imported inside each callback: `app.cli` is only
+# loaded when a command actually runs, not for `--help` or argument errors.
+
 
 @click.command
 @click.pass_obj
@@ -22,6 +13,8 @@ def repo(repo_path: Path) -> None:
     """
     Print the currently selected repository file path.
     """
+    from app.cli import repo_path_cmd
+
     repo_path_cmd(repo_path=repo_path)
 
 
@@ -39,6 +32,8 @@ def list_all(repo_path: Path) -> None:
     """
     List all tasks.
     """
+    from app.cli import show_all_cmd
+
     show_all_cmd(repo_path=repo_path)
 
 
@@ -48,6 +43,8 @@ def list_todo(repo_path: Path) -> None:
     """
     List TODO tasks.
     """
+    from app.cli import show_todo_cmd
+
     show_todo_cmd(repo_path=repo_path)
 
 
@@ -57,6 +54,8 @@ def list_in_progress(repo_path: Path) -> None:
     """
     List IN PROGRESS tasks.
     """
+    from app.cli import show_in_progress_cmd
+
     show_in_progress_cmd(repo_path=repo_path)
 
 
@@ -66,6 +65,8 @@ def list_done(repo_path: Path) -> None:
     """
     List DONE tasks.
     """
+    from app.cli import show_done_cmd
+
     show_done_cmd(repo_path=repo_path)
 
 
@@ -76,6 +77,8 @@ def add(repo_path: Path, description: str) -> None:
     """
     Add a new task to the repository.
     """
+    from app.cli import add_task_cmd
+
     add_task_cmd(description, repo_path=repo_path)
 
 
@@ -87,6 +90,8 @@ def update(repo_path: Path, task_id: int, description: str) -> None:
     """
     Edit an existing task description.
     """
+    from app.cli import update_task_cmd
+
     update_task_cmd(task_id, description, repo_path=repo_path)
 
 
@@ -97,6 +102,8 @@ def delete(repo_path: Path, task_id: int) -> None:
     """
     Remove a task from the repository.
     """
+    from app.cli import delete_task_cmd
+
     delete_task_cmd(task_id, repo_path=repo_path)
 
 
@@ -107,6 +114,8 @@ def mark_in_progress(repo_path: Path, task_id: int) -> None:
     """
     Mark a task as IN PROGRESS.
     """
+    from app.cli import mark_in_progress_cmd
+
     mark_in_progress_cmd(task_id, repo_path=repo_path)
 
 
@@ -117,4 +126,6 @@ def mark_done(repo_path: Path, task_id: int) -> None:
     """
     Mark a task as DONE.
     """
+    from app.cli import mark_done_cmd
+
     mark_done_cmd(task_id, repo_path=repo_path)
@@ -9,9 +9,11 @@ class TaskStatusEnum(StrEnum):
     IN_PROGRESS = "in_progress"
     DONE = "done"
 
-    @property
-    def label(self) -> str:
-        return self.value.replace("_", " ").upper()
+    label: str
+
+    def __init__(self, value: str) -> None:
+        # Computed once per member: `label` is a plain attribute, not a property.
+        self.label = value.replace("_", " ").upper()
 
 
 @unique
@@ -19,6 +21,7 @@ class MessageKind(Enum):
     INFO = "info"
     ERROR = "error"
 
-    @property
-    def label(self) -> str:
-        return self.value.upper()
+    label: str
+
+    def __init__(self, value: str) -> None:
+        self.label = value.upper()
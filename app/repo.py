@@ -1,14 +1,37 @@
+import os
 import json
 import errno
+import bisect
+import operator
+import functools
+import contextlib
 from pathlib import Path
-from app.schemas import Task, TypedDictType, HasId, ISO_DATETIME, TASK_REPO_SCHEMA
+from app.schemas import Task, HasId, ISO_DATETIME, TASK_REPO_SCHEMA
 from app.enums import TaskStatusEnum
-from typing import Final, Any, Literal, get_origin, get_args, cast, TypeVar
+from typing import (
+    Final,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Literal,
+    get_origin,
+    get_args,
+    cast,
+    TypeVar,
+    TYPE_CHECKING,
+    overload,
+)
 from datetime import datetime, timezone
 
+if TYPE_CHECKING:
+    from app.schemas import TypedDictType
+
 __all__ = (
     "load_tasks",
     "save_task",
+    "save_tasks",
     "create_task",
     "delete_task",
     "update_task",
@@ -18,7 +41,9 @@ __all__ = (
 )
 
 REPO_DIR_NAME: Final[str] = "data"
-REPO_DIR_PATH: Final[Path] = Path(__file__).resolve().parents[1] / REPO_DIR_NAME
+# `__file__` is already absolute for an imported module; `absolute()` only
+# guards the odd relative case and, unlike `resolve()`, does no filesystem calls.
+REPO_DIR_PATH: Final[Path] = Path(__file__).absolute().parents[1] / REPO_DIR_NAME
 
 REPO_FILE_NAME: Final[str] = "tasks.json"
 REPO_FILE_PATH: Final[Path] = REPO_DIR_PATH / REPO_FILE_NAME
@@ -45,7 +70,15 @@ ITEM_INVALID_AT_INDEX_ERROR: Final[str] = (
 
 TASK_NOT_FOUND_ERROR: Final[str] = "Task with id {task_id} not found"
 
-_T = TypeVar("_T", bound=TypedDictType)
+# Compact JSON output: no whitespace after item and key separators.
+_COMPACT_SEPARATORS: Final[tuple[str, str]] = (",", ":")
+
+# How many trailing bytes `_append` inspects to find the closing bracket.
+_APPEND_TAIL_SIZE: Final[int] = 4096
+
+_ITEM_ID: Final[Callable[[Any], Any]] = operator.itemgetter("id")
+
+_T = TypeVar("_T", bound="TypedDictType")
 _U = TypeVar("_U", bound=HasId)
 
 
@@ -63,6 +96,7 @@ def _check_value_type(value: Any, expected_type: Any) -> bool:
 
     Supported checks:
         - Literal[...] (e.g. Literal["todo", "done"])
+        - tuple of allowed values (e.g. TASK_STATUS_ORDER)
         - plain classes / builtins (e.g. int, str)
 
     Notes:
@@ -88,10 +122,14 @@ def _check_value_type(value: Any, expected_type: Any) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=64)
 def _type_repr(expected_type: Any) -> str:
     """
     Return a human-readable representation of `expected_type` for error messages.
 
+    Only called once a check has failed; the result is cached per type, so
+    repeated errors against the same field skip the `typing` introspection.
+
     Examples:
         - Literal["a", "b"] -> "'a' or 'b'"
         - str -> "str"
@@ -115,25 +153,26 @@ def _type_repr(expected_type: Any) -> str:
     return str(expected_type)
 
 
-def _assert_dict_by_dict_schema(obj: object, schema: dict[str, object]) -> None:
+def _assert_dict_by_dict_schema(obj: object, schema: Mapping[str, object]) -> None:
     if not isinstance(obj, dict):
         raise ValueError(VALIDATION_EXPECTED_DICT_ERROR.format(got=type(obj).__name__))
 
     # required keys
-    missing = [k for k in schema if k not in obj]
+    # Key set differences run in C; the lists only restore a stable order
+    # for the error message.
+    missing = schema.keys() - obj.keys()
     if missing:
-        raise ValueError(VALIDATION_MISSING_KEYS_ERROR.format(keys=missing))
+        keys = [k for k in schema if k in missing]
+        raise ValueError(VALIDATION_MISSING_KEYS_ERROR.format(keys=keys))
 
     # extra keys
-    extra = [k for k in obj if k not in schema]
+    extra = obj.keys() - schema.keys()
     if extra:
-        raise ValueError(VALIDATION_UNEXPECTED_KEYS_ERROR.format(keys=extra))
+        keys = [k for k in obj if k in extra]
+        raise ValueError(VALIDATION_UNEXPECTED_KEYS_ERROR.format(keys=keys))
 
-    # type check
+    # type check (every schema key is present at this point)
     for key, expected_type in schema.items():
-        if key not in obj:
-            continue
-
         value = obj[key]
         if not _check_value_type(value, expected_type):
             raise ValueError(
@@ -146,12 +185,16 @@ def _assert_dict_by_dict_schema(obj: object, schema: dict[str, object]) -> None:
 
 
 def _assert_list_valid_by_dict_schema(
-    data: object, *, schema: dict[str, object], repo_path: Path
+    data: object, *, schema: Mapping[str, object], repo_path: Path
 ) -> None:
     if not isinstance(data, list):
         raise ValueError(REPO_FORMAT_INVALID_ERROR)
 
+    check = _dict_schema_check(schema)
     for i, item in enumerate(data):
+        if check(item):
+            continue
+
         try:
             _assert_dict_by_dict_schema(item, schema)
         except ValueError as e:
@@ -162,6 +205,102 @@ def _assert_list_valid_by_dict_schema(
             ) from e
 
 
+def _value_check_src(expected_type: Any, var: str, ns: dict[str, object]) -> str:
+    """
+    Return a Python expression checking `var` against `expected_type`.
+
+    Mirrors `_check_value_type`, but resolves the expected type once: constants
+    the expression needs (types, frozensets of allowed values) are stored in
+    `ns` under generated names.
+    """
+    name = f"_c{len(ns)}"
+
+    if get_origin(expected_type) is Literal:
+        ns[name] = frozenset(get_args(expected_type))
+        return f"{var} in {name}"
+
+    if isinstance(expected_type, tuple):
+        ns[name] = frozenset(expected_type)
+        return f"{var} in {name}"
+
+    if expected_type is ISO_DATETIME:
+        # Parsed inline rather than through `_is_iso_datetime`: a non-string
+        # or malformed value raises, which the generated function reports as
+        # invalid. A parsed datetime is never None.
+        return f"_fromisoformat({var}) is not None"
+
+    if isinstance(expected_type, type):
+        ns[name] = expected_type
+        return f"isinstance({var}, {name})"
+
+    return "False"
+
+
+def _compile_check(
+    fields: Mapping[str, object], required: frozenset[str], name: str
+) -> Callable[[object], bool]:
+    """
+    Compile a straight-line validity check for a dict with the given fields.
+
+    The generated function has the key set checks and per-field type checks
+    inlined, with no `typing` calls left. It only answers "valid or not":
+    error details are produced by the reflective validators.
+    """
+    ns: dict[str, object] = {
+        "_fromisoformat": datetime.fromisoformat,
+        "_required": required,
+        "_allowed": frozenset(fields),
+    }
+    lines = [
+        "def check(obj):",
+        "    if not isinstance(obj, dict):",
+        "        return False",
+        "    keys = obj.keys()",
+        "    if not (_required <= keys and keys <= _allowed):",
+        "        return False",
+        "    try:",
+    ]
+    for key, expected_type in fields.items():
+        test = _value_check_src(expected_type, "v", ns)
+        if key in required:
+            lines.append(f"        v = obj[{key!r}]")
+            lines.append(f"        if not ({test}):")
+            lines.append("            return False")
+        else:
+            lines.append(f"        if {key!r} in obj:")
+            lines.append(f"            v = obj[{key!r}]")
+            lines.append(f"            if not ({test}):")
+            lines.append("                return False")
+    lines += [
+        # unhashable values (lists, dicts) in a frozenset membership test,
+        # values rejected by `fromisoformat`
+        "    except (TypeError, ValueError):",
+        "        return False",
+        "    return True",
+    ]
+
+    exec(compile("\n".join(lines), f"<{name} check>", "exec"), ns)
+    return cast(Callable[[object], bool], ns["check"])
+
+
+def _dict_schema_check(schema: Mapping[str, object]) -> Callable[[object], bool]:
+    """
+    Return the compiled validity check for a dict schema (all keys required).
+
+    Checks are cached by the schema's contents, not its identity: equal
+    schemas share one compiled function, and a schema changed after its
+    first use gets a fresh check instead of a stale one.
+    """
+    return _dict_schema_check_for(tuple(schema.items()))
+
+
+@functools.lru_cache(maxsize=None)
+def _dict_schema_check_for(
+    fields: tuple[tuple[str, object], ...],
+) -> Callable[[object], bool]:
+    return _compile_check(dict(fields), frozenset(k for k, _ in fields), "dict schema")
+
+
 def _assert_typed_dict(obj: object, schema: type[_T]) -> None:
     """
     Assert that `obj` conforms to the given TypedDict schema at runtime.
@@ -179,14 +318,16 @@ def _assert_typed_dict(obj: object, schema: type[_T]) -> None:
     ann = schema.__annotations__
 
     # required keys
-    missing = [k for k in ann if k not in obj and k in schema.__required_keys__]
+    missing = schema.__required_keys__ - obj.keys()
     if missing:
-        raise ValueError(VALIDATION_MISSING_KEYS_ERROR.format(keys=missing))
+        keys = [k for k in ann if k in missing]
+        raise ValueError(VALIDATION_MISSING_KEYS_ERROR.format(keys=keys))
 
     # extra keys
-    extra = [k for k in obj if k not in ann]
+    extra = obj.keys() - ann.keys()
     if extra:
-        raise ValueError(VALIDATION_UNEXPECTED_KEYS_ERROR.format(keys=extra))
+        keys = [k for k in obj if k in extra]
+        raise ValueError(VALIDATION_UNEXPECTED_KEYS_ERROR.format(keys=keys))
 
     # type check
     for key, expected_type in ann.items():
@@ -215,7 +356,7 @@ def _assert_list_valid(data: object, *, schema: type[_T], repo_path: Path) -> No
         - raises an exception with details (including an item index and file path).
 
     Args:
-        data: Decoded JSON value (typically returned by `json.load`).
+        data: Decoded JSON value (typically returned by `json.loads`).
         schema: TypedDict schema used to validate each list element.
         repo_path: Path included in error messages (useful for editor click-through).
 
@@ -245,7 +386,7 @@ def _as_list(data: object, *, schema: type[_T], repo_path: Path) -> list[_T]:
     `list[T]` for static type checkers.
 
     Args:
-        data: Decoded JSON value (typically returned by `json.load`).
+        data: Decoded JSON value (typically returned by `json.loads`).
         schema: TypedDict schema used to validate each list element.
         repo_path: Repository file path used in error messages.
 
@@ -260,12 +401,78 @@ def _as_list(data: object, *, schema: type[_T], repo_path: Path) -> list[_T]:
 
 
 def _as_task_list(
-    data: object, *, schema: dict[str, object], repo_path: Path
+    data: object, *, schema: Mapping[str, object], repo_path: Path
 ) -> list[Task]:
     _assert_list_valid_by_dict_schema(data, schema=schema, repo_path=repo_path)
     return cast(list[Task], data)
 
 
+@overload
+def _read_json(repo_path: Path) -> object: ...
+
+
+@overload
+def _read_json(
+    repo_path: Path, *, digest: Literal[True]
+) -> tuple[object, str | None]: ...
+
+
+def _read_json(
+    repo_path: Path, *, digest: bool = False
+) -> object | tuple[object, str | None]:
+    """
+    Read and decode the repository file without validating its contents.
+
+    The file is read with a single `read_bytes` call, skipping the text-mode
+    file wrapper. The bytes are decoded the way `json.loads` would (UTF-8,
+    with BOM detection) and released before parsing, so the raw buffer and
+    the decoded text are never both alive while the objects are built.
+
+    Behavior:
+        - If the file does not exist: returns an empty list.
+        - If the file is not valid JSON / UTF-8: raises ValueError.
+
+    Args:
+        repo_path: Path to the repository JSON file.
+        digest: Also return the content digest (see `_content_digest`) of the
+            bytes the payload was decoded from, or None if the file does not
+            exist. Only `load_tasks` needs it; other reads skip the hashing.
+
+    Raises:
+        ValueError: If the file contents cannot be decoded (corrupted file).
+        OSError: If the file cannot be read due to filesystem-related errors.
+    """
+    try:
+        raw = repo_path.read_bytes()
+        content_digest = _content_digest(raw) if digest else None
+        text = raw.decode(json.detect_encoding(raw), "surrogatepass")
+        del raw
+        data = json.loads(text)
+    except FileNotFoundError:
+        data, content_digest = [], None
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(REPO_CORRUPTED_ERROR.format(repo_path=repo_path)) from e
+    except OSError as e:
+        if getattr(e, "errno", None) == errno.EACCES:
+            raise OSError(
+                REPO_PERMISSION_DENIED_ERROR.format(repo_path=repo_path)
+            ) from e
+
+        raise OSError(REPO_READ_ERROR.format(repo_path=repo_path, detail=str(e))) from e
+
+    if digest:
+        return data, content_digest
+    return data
+
+
+def _content_digest(raw: bytes) -> str:
+    # Imported here: `app.main` imports this module on every invocation, and
+    # only `load_tasks` hashes the repository.
+    import hashlib
+
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
 def _load(*, schema: type[_T], repo_path: Path) -> list[_T]:
     """
     Load and validate a list of items from a JSON repository file.
@@ -289,60 +496,103 @@ def _load(*, schema: type[_T], repo_path: Path) -> list[_T]:
         ValueError: If the JSON is corrupted or the decoded payload is invalid.
         OSError: If the file cannot be read due to filesystem-related errors.
     """
-    try:
-        with repo_path.open(encoding="utf-8") as repo_file:
-            data: object = json.load(repo_file)
-    except FileNotFoundError:
-        data = []
-    except json.JSONDecodeError as e:
-        raise ValueError(REPO_CORRUPTED_ERROR.format(repo_path=repo_path)) from e
-    except OSError as e:
-        if getattr(e, "errno", None) == errno.EACCES:
-            raise OSError(
-                REPO_PERMISSION_DENIED_ERROR.format(repo_path=repo_path)
-            ) from e
-
-        raise OSError(REPO_READ_ERROR.format(repo_path=repo_path, detail=str(e))) from e
+    data = _read_json(repo_path)
 
     return _as_list(data, schema=schema, repo_path=repo_path)
 
 
-def _load_t(*, schema: dict[str, object], repo_path: Path) -> list[Task]:
-    try:
-        with repo_path.open(encoding="utf-8") as repo_file:
-            data: object = json.load(repo_file)
-    except FileNotFoundError:
-        data = []
-    except json.JSONDecodeError as e:
-        raise ValueError(REPO_CORRUPTED_ERROR.format(repo_path=repo_path)) from e
-    except OSError as e:
-        if getattr(e, "errno", None) == errno.EACCES:
-            raise OSError(
-                REPO_PERMISSION_DENIED_ERROR.format(repo_path=repo_path)
-            ) from e
+def _load_unchecked(*, repo_path: Path) -> list[Any]:
+    """
+    Load the repository list for an internal read-modify-write cycle.
 
-        raise OSError(REPO_READ_ERROR.format(repo_path=repo_path, detail=str(e))) from e
+    Unlike `load_tasks`, items are not validated: only the top-level shape (a
+    JSON array) is checked. Mutations validate the items they touch and write
+    the rest back unchanged, so a full validation pass per write is skipped.
 
-    return _as_task_list(data, schema=schema, repo_path=repo_path)
+    Raises:
+        ValueError: If the JSON is corrupted or is not an array.
+        OSError: If the file cannot be read due to filesystem-related errors.
+    """
+    data = _read_json(repo_path)
+    if not isinstance(data, list):
+        raise ValueError(REPO_FORMAT_INVALID_ERROR)
+
+    return data
+
+
+# `json.dumps` with non-default options builds a fresh encoder on every call;
+# records are all encoded with the same options, so share one instance.
+_RECORD_ENCODER: Final[json.JSONEncoder] = json.JSONEncoder(
+    ensure_ascii=False, separators=_COMPACT_SEPARATORS
+)
+
+
+def _dumps_record(item: object) -> str:
+    return _RECORD_ENCODER.encode(item)
+
+
+def _iter_records(items: list[Any]) -> Iterator[bytes]:
+    """
+    Serialize `items` as a JSON array with one compact record per line.
+
+    Each record goes through the compact encoder (no pretty-printing), while
+    the file stays readable and diff-friendly:
 
+        [
+        {"id":1,...},
+        {"id":2,...}
+        ]
 
-def _write_all(items: list[_T], *, repo_path: Path, indent: int | None = 1) -> None:
+    The encoded file contents are yielded piece by piece, so the whole
+    payload is never held in memory at once.
+    """
+    if not items:
+        yield b"[]"
+        return
+
+    sep = b"[\n"
+    for item in items:
+        yield sep
+        yield _dumps_record(item).encode("utf-8")
+        sep = b",\n"
+    yield b"\n]"
+
+
+def _write_all(items: list[Any], *, repo_path: Path) -> None:
     """
     Write the full repository payload to disk.
 
     Notes:
         - Parent directories are created automatically.
-        - The repository file is overwritten.
+        - `items` are written as given, without validation: new items are
+          validated where they enter the repository (`save_tasks`), and
+          existing records are passed through untouched.
+        - Records are serialized and streamed into the temp file one at a
+          time; a serialization error discards the temp file and leaves the
+          existing repository untouched.
+        - The repository file is replaced atomically (written to a `.tmp`
+          sibling and fsynced first, then renamed over the original).
 
     Args:
         items: List of JSON-serializable items to write.
         repo_path: Path to the repository JSON file.
-        indent: JSON indentation level. Use `None` for compact output.
 
     Raises:
         OSError: If the file cannot be created/opened/written.
         TypeError: If `items` cannot be JSON-serialized.
     """
+    _replace_file(_iter_records(items), repo_path=repo_path)
+
+
+def _replace_file(chunks: Iterable[bytes], *, repo_path: Path) -> None:
+    """
+    Atomically replace the repository file with the concatenated `chunks`.
+
+    Raises:
+        OSError: If the parent directory or the file cannot be created/written.
+        TypeError: If producing a chunk fails (e.g. a value that cannot be
+            JSON-serialized); the repository file is left untouched.
+    """
     try:
         repo_path.parent.mkdir(parents=True, exist_ok=True)
     except OSError as e:
@@ -354,9 +604,90 @@ def _write_all(items: list[_T], *, repo_path: Path, indent: int | None = 1) -> N
             REPO_MKDIR_ERROR.format(repo_dir=repo_path.parent, detail=str(e))
         ) from e
 
+    # Write a sibling temp file and atomically swap it in: readers never see
+    # a truncated or half-written repository. The data is fsynced before the
+    # rename so a crash cannot leave an empty file under the final name.
+    tmp_path = repo_path.with_name(repo_path.name + ".tmp")
     try:
-        with repo_path.open("w", encoding="utf-8") as repo_file:
-            json.dump(items, repo_file, ensure_ascii=False, indent=indent)
+        with tmp_path.open("wb") as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, repo_path)
+    except BaseException as e:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+        if not isinstance(e, OSError):
+            raise
+        if getattr(e, "errno", None) == errno.EACCES:
+            raise OSError(
+                REPO_PERMISSION_DENIED_ERROR.format(repo_path=repo_path)
+            ) from e
+        raise OSError(
+            REPO_WRITE_ERROR.format(repo_path=repo_path, detail=str(e))
+        ) from e
+
+
+def _append(items: list[Any], *, repo_path: Path) -> bool:
+    """
+    Append `items` to the repository JSON array in place.
+
+    Only the tail of the file is read and rewritten, so the cost of an append
+    does not depend on the repository size. For a file in the layout written
+    by `_write_all`, the produced bytes are identical to a full rewrite.
+
+    Notes:
+        - The closing `]` is located by scanning backward past trailing
+          whitespace; the new records are written one per line right after
+          the last element (or the opening `[`), followed by a new `]`.
+        - Existing repository contents are neither parsed nor validated.
+        - Unlike `_write_all`, this overwrites the file in place rather than
+          replacing it atomically. The write is flushed and fsynced before
+          returning, but a crash or full disk in the middle of it can still
+          leave a torn file (e.g. the old `]` already overwritten), which
+          later loads report as corrupted.
+
+    Args:
+        items: JSON-serializable items to append.
+        repo_path: Path to the repository JSON file.
+
+    Returns:
+        True if the items were appended, False if the file is missing or its
+        tail does not look like the end of a JSON array (the caller should
+        fall back to a full rewrite).
+
+    Raises:
+        OSError: If the file cannot be opened/read/written.
+        TypeError: If `items` cannot be JSON-serialized.
+    """
+    records = ",\n".join(map(_dumps_record, items))
+
+    try:
+        with repo_path.open("r+b") as repo_file:
+            size = repo_file.seek(0, os.SEEK_END)
+            tail_start = max(size - _APPEND_TAIL_SIZE, 0)
+            repo_file.seek(tail_start)
+            tail = repo_file.read().rstrip()
+
+            # The tail must end with `]`, preceded by `[` (empty array) or
+            # by the end of the last object.
+            before = tail[:-1].rstrip()
+            if not tail.endswith(b"]") or not before.endswith((b"[", b"}")):
+                return False
+
+            repo_file.seek(0)
+            if not repo_file.read(_APPEND_TAIL_SIZE).lstrip().startswith(b"["):
+                return False
+
+            sep = "\n" if before.endswith(b"[") else ",\n"
+
+            repo_file.seek(tail_start + len(before))
+            repo_file.write((sep + records + "\n]").encode("utf-8"))
+            repo_file.truncate()
+            repo_file.flush()
+            os.fsync(repo_file.fileno())
+    except FileNotFoundError:
+        return False
     except OSError as e:
         if getattr(e, "errno", None) == errno.EACCES:
             raise OSError(
@@ -366,6 +697,8 @@ def _write_all(items: list[_T], *, repo_path: Path, indent: int | None = 1) -> N
             REPO_WRITE_ERROR.format(repo_path=repo_path, detail=str(e))
         ) from e
 
+    return True
+
 
 def _save(item: _T, *, schema: type[_T], repo_path: Path) -> None:
     """
@@ -373,7 +706,9 @@ def _save(item: _T, *, schema: type[_T], repo_path: Path) -> None:
 
     Notes:
         - `item` is validated against `schema` before writing.
-        - Existing repository contents are loaded and validated as well.
+        - The item is appended in place when possible (see `_append`);
+          otherwise existing repository contents are loaded and rewritten
+          as-is (they are not re-validated).
 
     Args:
         item: Item to append (must be JSON-serializable).
@@ -388,28 +723,186 @@ def _save(item: _T, *, schema: type[_T], repo_path: Path) -> None:
     """
     _assert_typed_dict(item, schema=schema)
 
-    data = _load(schema=schema, repo_path=repo_path)
+    if _append([item], repo_path=repo_path):
+        return
+
+    data = _load_unchecked(repo_path=repo_path)
 
     data.append(item)
 
     _write_all(data, repo_path=repo_path)
 
 
-def _save_t(task: Task, *, schema: dict[str, object], repo_path: Path) -> None:
-    _assert_dict_by_dict_schema(task, schema=schema)
+def _save_t(
+    tasks: list[Task], *, schema: Mapping[str, object], repo_path: Path
+) -> None:
+    for task in tasks:
+        _assert_dict_by_dict_schema(task, schema=schema)
+
+    _save_trusted(tasks, repo_path=repo_path)
+
+
+def _save_trusted(tasks: list[Task], *, repo_path: Path) -> None:
+    """
+    Append tasks that are valid by construction, without re-validating them.
+
+    Only for tasks built inside this module from typed inputs (see
+    `create_task`); anything coming from callers goes through `_save_t`.
+    """
+    if _append(tasks, repo_path=repo_path):
+        return
 
-    data = _load_t(schema=schema, repo_path=repo_path)
+    data = _load_unchecked(repo_path=repo_path)
 
-    data.append(task)
+    data.extend(tasks)
 
     _write_all(data, repo_path=repo_path)
 
 
+def _meta_path(repo_path: Path) -> Path:
+    return repo_path.with_name(repo_path.name + ".meta")
+
+
+def _file_stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_ino, st.st_mtime_ns, st.st_size]
+
+
+def _read_meta(
+    repo_path: Path, stamp: list[int] | None = None
+) -> dict[str, Any] | None:
+    """
+    Return the repository metadata if it is current.
+
+    The metadata file (`<repo file>.meta`) records facts about one exact state
+    of the repository file, identified by its stamp (inode, mtime, size):
+
+        - "next_id": the next task id (max id + 1);
+        - "digest": the content digest (see `_content_digest`) of that file
+          state if it passed full schema validation, otherwise null.
+
+    It is only trusted while the repository file is still in exactly that
+    state; any other write (update, delete, manual edit) makes it stale.
+
+    Args:
+        repo_path: Path to the repository JSON file.
+        stamp: Current stamp of the repository file, if the caller already
+            has it; otherwise the file is stat-ed here.
+
+    Returns:
+        The metadata dict, or None if it is missing, unreadable or stale.
+    """
+    try:
+        meta = json.loads(_meta_path(repo_path).read_bytes())
+        if stamp is None:
+            stamp = _file_stamp(repo_path)
+    except (OSError, ValueError):
+        return
+
+    if not isinstance(meta, dict) or meta.get("stamp") != stamp:
+        return
+
+    return meta
+
+
+def _read_next_id(meta: dict[str, Any] | None) -> int | None:
+    """
+    Return the next task id from current metadata (see `_read_meta`), or None
+    if there is none (the caller should scan the repository instead).
+    """
+    next_id = None if meta is None else meta.get("next_id")
+    if type(next_id) is not int:
+        return
+
+    return next_id
+
+
+def _write_meta(
+    repo_path: Path,
+    next_id: int,
+    *,
+    digest: str | None = None,
+    stamp: list[int] | None = None,
+) -> None:
+    """
+    Record metadata for the current state of the repository file.
+
+    Best effort: if the metadata cannot be written, the next `create_task`
+    simply falls back to scanning the repository, and the next `load_tasks`
+    to full validation.
+
+    Args:
+        repo_path: Path to the repository JSON file.
+        next_id: Next task id for this file state.
+        digest: Content digest of this file state if it is known to match
+            the Task schema (see `load_tasks`), otherwise None.
+        stamp: Stamp of the file state the facts were established for; it
+            must be taken before the file was read. Defaults to the current one.
+    """
+    meta_path = _meta_path(repo_path)
+    tmp_path = meta_path.with_name(meta_path.name + ".tmp")
+    with contextlib.suppress(OSError):
+        if stamp is None:
+            stamp = _file_stamp(repo_path)
+        meta = {"next_id": next_id, "stamp": stamp, "digest": digest}
+        tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp_path, meta_path)
+
+
 def _find_item_idx(items: list[_U], item_id: int) -> int | None:
     """
-    Return the index of the first item whose 'id' equals `item_id`, or None if not found.
+    Return the index of the item whose 'id' equals `item_id`, or None if not found.
+
+    Tasks are appended with increasing ids, so the repository list is normally
+    sorted by id and a binary search finds the item in O(log N). If the list
+    is not sorted (e.g. a hand-edited file), this falls back to a linear scan.
+
+    Items that are not dicts are skipped, so unchecked repository lists
+    (see `_load_unchecked`) can be searched safely.
+    """
+    try:
+        i = bisect.bisect_left(items, item_id, key=_ITEM_ID)
+    except (TypeError, KeyError):  # non-dict item, missing or non-int id
+        pass
+    else:
+        if i < len(items):
+            t = items[i]
+            if isinstance(t, dict) and t.get("id") == item_id:
+                return i
+
+    return next(
+        (
+            i
+            for i, t in enumerate(items)
+            if isinstance(t, dict) and t.get("id") == item_id
+        ),
+        None,
+    )
+
+
+def _find_task_idx(data: list[Any], task_id: int, *, repo_path: Path) -> int:
     """
-    return next((i for i, t in enumerate(items) if t["id"] == item_id), None)
+    Return the index of the task with id `task_id` in an unchecked list.
+
+    Only the matched item is validated against the Task schema; the rest of
+    the repository is passed through untouched.
+
+    Raises:
+        ValueError: If no task with the given id exists, or if the matched
+            item does not match the Task schema.
+    """
+    idx = _find_item_idx(data, task_id)
+    if idx is None:
+        raise ValueError(TASK_NOT_FOUND_ERROR.format(task_id=task_id))
+
+    try:
+        _assert_dict_by_dict_schema(data[idx], TASK_REPO_SCHEMA)
+    except ValueError as e:
+        raise ValueError(
+            ITEM_INVALID_AT_INDEX_ERROR.format(repo_path=repo_path, index=idx, detail=e)
+        ) from e
+
+    return idx
 
 
 def load_tasks(*, repo_path: Path = REPO_FILE_PATH) -> list[Task]:
@@ -424,6 +917,13 @@ def load_tasks(*, repo_path: Path = REPO_FILE_PATH) -> list[Task]:
         - If the file contains invalid JSON: raises ValueError (corrupted file).
         - If the JSON is valid but has an invalid shape: raises ValueError.
 
+    Notes:
+        - Once a repository file state has been validated, a digest of its
+          contents is recorded in the metadata file (see `_read_meta`). Later
+          loads whose bytes hash to the same digest skip schema validation;
+          any other contents are validated again. This means a read-only
+          load may write the metadata file.
+
     Args:
         repo_path: Path to the repository JSON file.
 
@@ -434,8 +934,32 @@ def load_tasks(*, repo_path: Path = REPO_FILE_PATH) -> list[Task]:
         ValueError: If the JSON is corrupted or the decoded payload is invalid.
         OSError: If the file cannot be read due to filesystem-related errors.
     """
+    try:
+        stamp = _file_stamp(repo_path)
+    except OSError:
+        stamp = None
+
+    meta = None if stamp is None else _read_meta(repo_path, stamp)
     # return _load(schema=Task, repo_path=repo_path)
-    return _load_t(schema=TASK_REPO_SCHEMA, repo_path=repo_path)
+    data, digest = _read_json(repo_path, digest=True)
+
+    # The digest covers the exact bytes parsed above, so a match means these
+    # contents already passed validation.
+    if (
+        digest is not None
+        and meta is not None
+        and meta.get("digest") == digest
+        and isinstance(data, list)
+    ):
+        return cast(list[Task], data)
+
+    tasks = _as_task_list(data, schema=TASK_REPO_SCHEMA, repo_path=repo_path)
+
+    if stamp is not None and digest is not None:
+        next_id = max(map(_ITEM_ID, tasks), default=0) + 1
+        _write_meta(repo_path, next_id, digest=digest, stamp=stamp)
+
+    return tasks
 
 
 def save_task(task: Task, *, repo_path: Path = REPO_FILE_PATH) -> None:
@@ -444,7 +968,9 @@ def save_task(task: Task, *, repo_path: Path = REPO_FILE_PATH) -> None:
 
     Notes:
         - `task` is validated against the Task schema before writing.
-        - Existing repository contents are loaded and validated as well.
+        - The task is appended in place when possible, without rewriting
+          the file; otherwise existing repository contents are loaded and
+          rewritten as-is (they are not re-validated).
 
     Args:
         task: Task object to append to the repository (must be JSON-serializable).
@@ -456,8 +982,34 @@ def save_task(task: Task, *, repo_path: Path = REPO_FILE_PATH) -> None:
         OSError: If the file or directories cannot be created/read/written.
         TypeError: If the resulting payload cannot be JSON-serialized.
     """
+    save_tasks([task], repo_path=repo_path)
+
+
+def save_tasks(tasks: Iterable[Task], *, repo_path: Path = REPO_FILE_PATH) -> None:
+    """
+    Append several tasks to the JSON repository file in one write.
+
+    All tasks are validated first, then written together: one in-place
+    append (or one full rewrite) regardless of how many tasks are given,
+    instead of one per task as with repeated `save_task` calls.
+
+    Args:
+        tasks: Task objects to append, in order (must be JSON-serializable).
+        repo_path: Path to the repository JSON file.
+
+    Raises:
+        ValueError: If any task is invalid (nothing is written), the
+            repository file is corrupted, or the repository contents have
+            an invalid format.
+        OSError: If the file or directories cannot be created/read/written.
+        TypeError: If the resulting payload cannot be JSON-serialized.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return
+
     # _save(task, schema=Task, repo_path=repo_path)
-    _save_t(task, schema=TASK_REPO_SCHEMA, repo_path=repo_path)
+    _save_t(tasks, schema=TASK_REPO_SCHEMA, repo_path=repo_path)
 
 
 def create_task(
@@ -474,11 +1026,16 @@ def create_task(
     in UTC using ISO 8601 format.
 
     Notes:
+        - The next id is cached in a `<repo file>.meta` file next to the
+          repository. While the repository file is unchanged since that cache
+          was written, the id is taken from it without loading the
+          repository; otherwise the repository is loaded and scanned.
         - Although `status` is provided as `TaskStatusEnum`, the repository stores
           the status as a plain string (`status.value`) to keep the JSON
           representation simple and compatible with the Task schema.
-        - This function writes the task immediately via `save_task` and does not
-          return the created task.
+        - This function writes the task immediately and does not return the
+          created task. The task is built from typed inputs, so it is not
+          re-validated against the Task schema (only `description` is checked).
 
     Args:
         description: Human-readable task description.
@@ -490,14 +1047,26 @@ def create_task(
 
     Raises:
         ValueError: If the repository file is corrupted or contains invalid data,
-            or if the produced task does not match the Task schema.
+            or if `description` is not a string.
         OSError: If the repository file cannot be read or written due to
             filesystem-related errors.
         TypeError: If the resulting payload cannot be JSON-serialized.
     """
-    data = load_tasks(repo_path=repo_path)
+    meta = _read_meta(repo_path)
+    next_id = _read_next_id(meta)
+    if next_id is None:
+        data = load_tasks(repo_path=repo_path)
+        next_id = max(map(_ITEM_ID, data), default=0) + 1
+
+    # The other fields are valid by construction: an int id, a TaskStatusEnum
+    # value and ISO timestamps. Only the caller-supplied description is checked.
+    if not isinstance(description, str):
+        raise ValueError(
+            VALIDATION_INVALID_TYPE_ERROR.format(
+                key="description", expected="str", got=description
+            )
+        )
 
-    next_id = max((task["id"] for task in data), default=0) + 1
     now = datetime.now(timezone.utc).isoformat()
 
     task: Task = {
@@ -508,12 +1077,17 @@ def create_task(
         "updated_at": now,
     }
 
-    save_task(task, repo_path=repo_path)
+    # Checked in debug runs only; `python -O` strips it.
+    assert _dict_schema_check(TASK_REPO_SCHEMA)(task), task
+
+    _save_trusted([task], repo_path=repo_path)
+    # The new contents have not been hashed, so the next load validates them.
+    _write_meta(repo_path, next_id + 1)
 
     return next_id
 
 
-def delete_task(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> None:
+def delete_task(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> Task:
     """
     Delete a task from the repository by its integer id.
 
@@ -521,22 +1095,25 @@ def delete_task(task_id: int, *, repo_path: Path = REPO_FILE_PATH) -> None:
         task_id: Task id to delete.
         repo_path: Path to the repository JSON file.
 
+    Returns:
+        The deleted task object.
+
     Raises:
         ValueError: If no task with the given id exists, or if the repository
             file is corrupted/invalid.
         OSError: If the file cannot be read or written due to filesystem errors.
         TypeError: If the resulting payload cannot be JSON-serialized.
     """
-    data = load_tasks(repo_path=repo_path)
+    data = _load_unchecked(repo_path=repo_path)
 
-    idx = _find_item_idx(data, task_id)
-    if idx is None:
-        raise ValueError(TASK_NOT_FOUND_ERROR.format(task_id=task_id))
+    idx = _find_task_idx(data, task_id, repo_path=repo_path)
 
-    del data[idx]
+    deleted = data.pop(idx)
 
     _write_all(data, repo_path=repo_path)
 
+    return deleted
+
 
 def update_task(
     task_id: int, description: str, *, repo_path: Path = REPO_FILE_PATH
@@ -562,11 +1139,9 @@ def update_task(
         OSError: If the file cannot be read or written due to filesystem errors.
         TypeError: If the resulting payload cannot be JSON-serialized.
     """
-    data = load_tasks(repo_path=repo_path)
+    data = _load_unchecked(repo_path=repo_path)
 
-    idx = _find_item_idx(data, task_id)
-    if idx is None:
-        raise ValueError(TASK_NOT_FOUND_ERROR.format(task_id=task_id))
+    idx = _find_task_idx(data, task_id, repo_path=repo_path)
 
     data[idx]["description"] = description
     data[idx]["updated_at"] = datetime.now(timezone.utc).isoformat()
@@ -600,11 +1175,9 @@ def _set_task_status(
         OSError: If the file cannot be read or written due to filesystem errors.
         TypeError: If the resulting payload cannot be JSON-serialized.
     """
-    data = load_tasks(repo_path=repo_path)
+    data = _load_unchecked(repo_path=repo_path)
 
-    idx = _find_item_idx(data, task_id)
-    if idx is None:
-        raise ValueError(TASK_NOT_FOUND_ERROR.format(task_id=task_id))
+    idx = _find_task_idx(data, task_id, repo_path=repo_path)
 
     data[idx]["status"] = task_status.value
     data[idx]["updated_at"] = datetime.now(timezone.utc).isoformat()
@@ -1,10 +1,12 @@
-from typing import TypedDict, Literal, Protocol, Any, NamedTuple, Final
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypedDict, Literal, NamedTuple, Final, Mapping
+
+if TYPE_CHECKING:
+    from typing import Protocol, Any
 
 __all__ = (
     "Task",
     "TaskStatus",
-    "TypedDictType",
-    "TaskRow",
     "HasId",
     "LoadTasksOk",
     "LoadTasksErr",
@@ -15,15 +17,22 @@ ISO_DATETIME = object()
 
 type TaskStatus = Literal["todo", "in_progress", "done"]
 
-TASK_STATUS: Final[tuple[str, ...]] = "todo", "in_progress", "done"
-
-TASK_REPO_SCHEMA: Final[dict[str, object]] = {
-    "id": int,
-    "description": str,
-    "status": TASK_STATUS,
-    "created_at": ISO_DATETIME,
-    "updated_at": ISO_DATETIME,
-}
+# Ordered: the repository schema uses it, so validation errors list the
+# statuses in this order. Direct membership checks can use the TASK_STATUS set.
+TASK_STATUS_ORDER: Final[tuple[str, ...]] = "todo", "in_progress", "done"
+
+TASK_STATUS: Final[frozenset[str]] = frozenset(TASK_STATUS_ORDER)
+
+# Read-only view: the schema is shared by every validator in the process.
+TASK_REPO_SCHEMA: Final[Mapping[str, object]] = MappingProxyType(
+    {
+        "id": int,
+        "description": str,
+        "status": TASK_STATUS_ORDER,
+        "created_at": ISO_DATETIME,
+        "updated_at": ISO_DATETIME,
+    }
+)
 
 
 class Task(TypedDict):
@@ -34,14 +43,6 @@ class Task(TypedDict):
     updated_at: str
 
 
-class TaskRow(TypedDict):
-    id: int
-    description: str
-    status: str
-    created_at: str
-    updated_at: str
-
-
 class LoadTasksOk(NamedTuple):
     success: Literal[True]
     value: list[Task]
@@ -56,7 +57,9 @@ class HasId(TypedDict):
     id: int
 
 
-class TypedDictType(Protocol):
-    __annotations__: dict[str, Any]
-    __required_keys__: frozenset[str]
-    __optional_keys__: frozenset[str]
+if TYPE_CHECKING:
+    # Only used as a static bound; no runtime isinstance() checks rely on it.
+    class TypedDictType(Protocol):
+        __annotations__: dict[str, Any]
+        __required_keys__: frozenset[str]
+        __optional_keys__: frozenset[str]